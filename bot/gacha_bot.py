@@ -1,14 +1,16 @@
 import ctypes
-import itertools
 import json
 import os
+import time
 import traceback
 from datetime import datetime
-from typing import Iterable
+from typing import Optional
 
 from ark import (Console, Player, Server, TribeLog, UserSettings, config,
                  exceptions)
 from discord import Embed  # type:ignore[import]
+from requests import Session  # type:ignore[import]
+from requests.adapters import HTTPAdapter  # type:ignore[import]
 
 from bot.recovery import Unstucking
 
@@ -17,6 +19,7 @@ from .settings import TowerSettings
 from .stations import (ARBStation, BerryFeedStation, CrystalStation,
                        GrindingStation, HealingStation, MeatFeedStation,
                        Station, YTrapStation)
+from .tools import RoundRobin
 from .webhooks import DiscordSettings, InfoWebhook, TimerWebhook
 
 
@@ -30,9 +33,31 @@ class GachaBot:
     ready. The order they are arranged in can be seen as a priority order.
     """
 
+    # the minimum time to idle for when no station is ready, so stations
+    # whose readiness cannot be predicted are still polled regularly
+    IDLE_POLL_INTERVAL = 1.0
+
+    __slots__ = (
+        "_config",
+        "settings",
+        "ark_settings",
+        "server",
+        "_http",
+        "info_webhook",
+        "tribelogs",
+        "timer_webhook",
+        "player",
+        "stations",
+        "_priority_stations",
+        "_ytrap_stations",
+    )
+
     def __init__(self) -> None:
         print("Bot started, initializing gacha bot...")
-        self.settings = TowerSettings.load()
+        with open("settings/settings.json") as f:
+            self._config: dict = json.load(f)
+
+        self.settings = TowerSettings.load(self._config)
         self._set_environment()
 
         self.ark_settings = UserSettings.load()
@@ -41,13 +66,19 @@ class GachaBot:
         self.server = Server(self.ark_settings.last_server)
         self.create_webhooks()
 
-        with open("settings/settings.json") as f:
-            self.player = Player(**json.load(f)["player"])
+        self.player = Player(**self._config["player"])
 
         self.stations = self.create_stations()
+
+        # the stations list never changes, so split it into the stations that
+        # need to be checked and the ytrap stations to fall back to
+        self._priority_stations = [s for s in self.stations if isinstance(s, Station)]
+        self._ytrap_stations: Optional[RoundRobin[YTrapStation]] = next(
+            (s for s in self.stations if isinstance(s, RoundRobin)), None
+        )
         print("Initialization successful.")
 
-    def create_stations(self) -> list[Station | Iterable[YTrapStation]]:
+    def create_stations(self) -> list[Station | RoundRobin[YTrapStation]]:
         """Creates a list of the stations the gacha bot will run, the stations
         are ordered by 'priority', e.g the crystal station comes first, the
         ytrap station comes last (if no other station was ready).
@@ -56,7 +87,7 @@ class GachaBot:
         and behave similar.
         """
         base_args = (self.player, self.tribelogs, self.info_webhook)
-        stations: list[Station | Iterable[YTrapStation]] = [HealingStation(*base_args)]
+        stations: list[Station | RoundRobin[YTrapStation]] = [HealingStation(*base_args)]
 
         grinding = GrindingStation(*base_args)
         arb = ARBStation(*base_args)
@@ -75,7 +106,7 @@ class GachaBot:
             if not station:
                 continue
 
-            if isinstance(station, (Station, itertools.cycle)):
+            if isinstance(station, (Station, RoundRobin)):
                 stations.append(station)
 
             elif isinstance(station, list):
@@ -85,15 +116,25 @@ class GachaBot:
 
     def create_webhooks(self) -> None:
         """Creates the webhooks from the discord settings, `None` if no webhook was passed."""
+        # all webhooks post to discord, share the connections between them
+        self._http = Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
         try:
-            settings = DiscordSettings.load()
-            self.info_webhook = InfoWebhook(settings.webhook_gacha, settings.user_id)
+            settings = DiscordSettings.load(self._config)
+            self.info_webhook = InfoWebhook(
+                settings.webhook_gacha, settings.user_id, self._http
+            )
 
             self.tribelogs = TribeLog(
                 settings.webhook_alert, settings.webhook_logs, settings.user_id
             )
             self.timer_webhook = TimerWebhook(
-                settings.webhook_state, self.server, self.tribelogs, settings.timer_pop
+                settings.webhook_state,
+                self.server,
+                self.tribelogs,
+                settings.timer_pop,
+                self._http,
             )
         except Exception as e:
             raise ConfigError(f"Failed to create one or more webhooks!\n{e}")
@@ -102,9 +143,17 @@ class GachaBot:
         """Gacha bots main call method, call repeatedly to keep doing the
         next task in line. Iterates over each station in our station list
         and checks for the first one to be ready.
+
+        If no station is ready, idles until the next station is expected to be
+        ready rather than checking all the stations again right away.
         """
+        task = None
         try:
             task = self._find_next_task()
+            if task is None:
+                self._idle(self._time_until_next_task())
+                return
+
             print(f"Found next task: '{task.name}'")
             task.complete()
 
@@ -119,16 +168,34 @@ class GachaBot:
             print(traceback.format_exc())
             self._unstuck()
 
-    def _find_next_task(self) -> Station:
-        for station in self.stations:
-            if isinstance(station, Station):
-                if station.is_ready():
-                    return station
-
-            elif isinstance(station, itertools.cycle):
-                return next(station)
+    def _find_next_task(self) -> Optional[Station]:
+        for station in self._priority_stations:
+            if station.is_ready():
+                return station
+
+        if self._ytrap_stations:
+            return next(self._ytrap_stations)
+        return None
+
+    def _time_until_next_task(self) -> float:
+        """Gets the time in seconds until the next station is expected to be ready,
+        at least `IDLE_POLL_INTERVAL` seconds. If any station cannot predict when
+        it is ready, it has to be polled again after `IDLE_POLL_INTERVAL`."""
+        deadlines = [s.next_ready_at for s in self._priority_stations]
+        if not deadlines or None in deadlines:
+            return self.IDLE_POLL_INTERVAL
+
+        return max(
+            self.IDLE_POLL_INTERVAL,
+            min(d for d in deadlines if d is not None) - time.monotonic(),
+        )
 
-        raise LookupError("Could not find a ready station!")
+    def _idle(self, duration: float) -> None:
+        """Idles for the given duration in `IDLE_POLL_INTERVAL` slices so that
+        pausing or terminating the bot is still noticed while idling."""
+        deadline = time.monotonic() + duration
+        while (remaining := deadline - time.monotonic()) > 0:
+            self.player.sleep(min(self.IDLE_POLL_INTERVAL, remaining))
 
     def start(self) -> None:
         try:
@@ -139,15 +206,12 @@ class GachaBot:
             self._inform_started()
         except exceptions.TerminatedError:
             print("Bot terminated!")
-            pass
 
     def _unstuck(self) -> None:
         unstucking = Unstucking(
             self.server, self.player, self.settings.game_launcher, self.info_webhook
         )
         unstucking.unstuck()
-        if not unstucking.reconnected:
-            return
 
     def _inform_started(self) -> None:
         """Sends a message to discord that the bot has been started"""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Optional
 
 import dacite
 
@@ -16,7 +16,9 @@ class TowerSettings:
     map: Literal["Genesis 2", "Aberration", "Other"]
 
     @staticmethod
-    def load() -> TowerSettings:
-        with open("settings/settings.json") as f:
-            data = json.load(f)["main"]
-        return dacite.from_dict(TowerSettings, data)
\ No newline at end of file
+    def load(config: Optional[dict] = None) -> TowerSettings:
+        if config is None:
+            with open("settings/settings.json") as f:
+                config = json.load(f)
+
+        return dacite.from_dict(TowerSettings, config["main"])
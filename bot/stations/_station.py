@@ -1,5 +1,6 @@
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 from ark import Bed, Player, TribeLog
@@ -31,6 +32,12 @@ class Station(ABC):
         The timestamp of the last completion, to check whether its ready
     """
 
+    interval: Optional[int] = None
+    last_completed: Optional[datetime] = None
+
+    # monotonic timestamp before which the station is known not to be ready
+    _earliest_ready = 0.0
+
     def __init__(
         self,
         name: str,
@@ -57,13 +64,36 @@ class Station(ABC):
     def is_ready(self) -> bool:
         """Checks whether the station is ready by comparing the station
         datas' interval to the last emptied datetime.
+
+        Once the time left is known the station is not checked again until
+        it has elapsed.
         """
+        if time.monotonic() < self._earliest_ready:
+            return False
+
         if self.interval is None or self.last_completed is None:
             return True
 
         time_diff = datetime.now() - self.last_completed
-        print(f"Time left for {self._name}: {(self.interval * 60) - time_diff.total_seconds()}")
-        return time_diff.total_seconds() > (self.interval * 60)
+        time_left = (self.interval * 60) - time_diff.total_seconds()
+        print(f"Time left for {self._name}: {time_left}")
+
+        if time_left >= 0:
+            self._earliest_ready = time.monotonic() + time_left
+            return False
+        return True
+
+    @property
+    def next_ready_at(self) -> Optional[float]:
+        """The timestamp (as given by `time.monotonic`) the station is expected
+        to be ready at, `None` if it cannot be predicted.
+        """
+        if self.interval is None or self.last_completed is None:
+            return None
+
+        # the last completion is a datetime so it can be saved, convert it
+        due = self.last_completed + timedelta(minutes=self.interval)
+        return time.monotonic() + (due - datetime.now()).total_seconds()
 
     def spawn(self) -> None:
         """Spawns at the station given the station datas bed object.
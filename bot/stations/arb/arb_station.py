@@ -297,7 +297,7 @@ class ARBStation(Station):
         Finishes with the remaining gasoline and wood deposited back into their
         dedis. Sets the most recent wood cooking timestamp upon finishing.
         """
-        start = time.time()
+        start = time.monotonic()
         if not self.forges_emptied:
             self.empty_forges()
             self.forges_emptied = True
@@ -322,7 +322,7 @@ class ARBStation(Station):
         self.forges_put_gas_back()
 
         self.craft_sparkpowder()
-        embed = self.create_forges_refilled_embed(round(time.time() - start))
+        embed = self.create_forges_refilled_embed(round(time.monotonic() - start))
         self._webhook.send_embed(embed)
 
         self._started_cooking_wood = datetime.now()
@@ -625,14 +625,14 @@ class ARBStation(Station):
         """
         self.empty_forges()
         self.spawn()
-        start = time.time()
+        start = time.monotonic()
 
         self.distribute_spark_evenly()
         for i in range(2):
             self.queue_gunpowder(transfer_mats=not i)
 
         embed = self.create_gunpowder_crafted_embed(
-            round(time.time() - start), 7500 * 6
+            round(time.monotonic() - start), 7500 * 6
         )
         self._webhook.send_embed(embed)
 
@@ -690,12 +690,12 @@ class ARBStation(Station):
         finished.
         """
         self.spawn()
-        start = time.time()
+        start = time.monotonic()
 
         self.empty_chembenches()
         self.take_metal_queue_arb()
 
-        embed = self.create_arb_queued_embed(round(time.time() - start))
+        embed = self.create_arb_queued_embed(round(time.monotonic() - start))
         self._webhook.send_embed(embed)
 
         self.status = Status.WAITING_FOR_ARB
@@ -720,7 +720,7 @@ class ARBStation(Station):
         once again needs to be set `ready` by the collection point.
         """
         self.travel_to_pickup_bed()
-        start = time.time()
+        start = time.monotonic()
 
         try:
             self.exo_mek.access()
@@ -740,7 +740,7 @@ class ARBStation(Station):
                 if amount:
                     break
 
-            embed = self.create_embed(round(time.time() - start), amount)
+            embed = self.create_embed(round(time.monotonic() - start), amount)
             self._webhook.send_embed(embed)
 
         finally:
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class Status(str, Enum):
+    WAITING_FOR_CRYSTALS = "Waiting for crystals"
+    CRYSTALS_PICKED = "Crystals picked up"
+    CRYSTALS_OPENED = "Crystals opened"
\ No newline at end of file
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import time
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
+import pydirectinput as input  # type: ignore[import]
 from ark import (
     Bed,
     Player,
@@ -19,12 +21,14 @@ from ark.items import *
 from discord import Embed  # type: ignore[import]
 
 from ...exceptions import NoCrystalAddedError
+from ...tools import format_amount, locate_any
 from ...webhooks import InfoWebhook, TimerWebhook
 from .._station import Station
 from ..arb import ARBStation
 from ..grinding import GrindingStation
 from ..ytrap import YTrapStation
 from ._settings import CrystalStationSettings
+from ._status import Status
 
 
 class CrystalStation(Station):
@@ -78,6 +82,49 @@ class CrystalStation(Station):
         TREE_PLATFORM,
     ]
 
+    # safeguard for the crystal opening loop, and how often it checks the
+    # inventory for crystals left since that is a template match each time.
+    # every tick opens a crystal from each of the 10 hotbar slots, so 200 ticks
+    # get through up to 2000 crystals, more than the inventory holds in one
+    # collection since they do not stack
+    _MAX_OPEN_TICKS = 200
+    _OPEN_CHECK_EVERY = 3
+
+    # how long to walk over the crystals for and how often to press F meanwhile
+    _PICKUP_WALK_DURATION = 1.8
+    _PICKUP_INTERVAL = 0.05
+
+    _STRYDER_ITEMS = (DUST, FLINT, STONE, FUNGAL_WOOD, BLACK_PEARL)
+    _TOP_VAULT_ITEMS = (
+        TREE_PLATFORM,
+        BEHEMOTH_GATE,
+        BEHEMOTH_GATEWAY,
+        METAL_GATE,
+        METAL_GATEWAY,
+    )
+
+    # mirror the item region and confidence `Inventory.find` uses in ark, which
+    # cannot look for several items within the same screenshot
+    _INVENTORY_ITEM_REGION = (1243, 232, 562, 710)
+    _INVENTORY_ITEM_CONFIDENCE = 0.8
+
+    # the turns to go from one dedi to the next, in order
+    _DEDI_TURNS = (
+        ("turn_x_by", 40),
+        ("turn_y_by", -50),
+        ("turn_x_by", -80),
+        ("turn_y_by", 50),
+    )
+
+    _VAULT: ClassVar[Optional[Structure]] = None
+
+    _EMBED_TEMPLATE = {
+        "type": "rich",
+        "color": 0x07F2EE,
+        "thumbnail": {"url": CRYSTAL_AVATAR},
+        "footer": {"text": "Ling Ling on top!"},
+    }
+
     def __init__(
         self,
         name: str,
@@ -102,20 +149,17 @@ class CrystalStation(Station):
         self.bed = Bed(name)
         self.dedi = TekDedicatedStorage()
         self.stryder = Stryder()
-        self.vault = Structure(
-            "Vault",
-            "assets/templates/vault.png",
-            capacity="assets/templates/vault_capped.png",
-        )
+        self.vault = self._get_vault()
         self.gen2 = gen2
 
         self._grinding_station = grinding_station
         self._arb_station = arb_station
 
         self._first_pickup = True
+        self.status = Status.WAITING_FOR_CRYSTALS
 
         self._total_pickups = 0
-        self._resources_made: dict[Item, int] = {}
+        self._resources_made: Counter[Item] = Counter()
         self.last_completed = datetime.now()
         self.interval = self.settings.crystal_interval
 
@@ -132,9 +176,10 @@ class CrystalStation(Station):
     ) -> list[CrystalStation]:
         settings = CrystalStationSettings.load()
 
+        prefix = settings.crystal_prefix
         return [
             CrystalStation(
-                f"{settings.crystal_prefix}{i:02d}",
+                f"{prefix}{i:02d}",
                 player,
                 tribelog,
                 info_webhook,
@@ -147,7 +192,23 @@ class CrystalStation(Station):
             for i in range(settings.crystal_beds)
         ]
 
+    @classmethod
+    def _get_vault(cls) -> Structure:
+        """Returns the vault structure, every crystal station faces the same
+        kind of vault so one instance is shared between all of them."""
+        if cls._VAULT is None:
+            cls._VAULT = Structure(
+                "Vault",
+                "assets/templates/vault.png",
+                capacity="assets/templates/vault_capped.png",
+            )
+        return cls._VAULT
+
     def is_ready(self) -> bool:
+        # an interrupted run is picked back up right away
+        if self.status != Status.WAITING_FOR_CRYSTALS:
+            return True
+
         if YTrapStation.total_ytraps_collected < self.settings.min_ytraps_collected:
             return False
 
@@ -160,21 +221,39 @@ class CrystalStation(Station):
         puts away the items into the vault as configured by the user.
 
         Keeps track of the amounts it has deposited into dedis and returns them.
+
+        The progress is kept in a `Status`, if a step fails the next attempt
+        resumes from there rather than starting over, for example crystals
+        that were already picked up are brought straight to the dedis.
         """
+        resuming = self.status != Status.WAITING_FOR_CRYSTALS
         try:
             self.spawn()
-            start = time.time()
+            start = time.monotonic()
 
-            # open the crystals and deposit the items into dedis
-            try:
-                self._pick_crystals()
-            except NoCrystalAddedError:
-                if self.gen2:
-                    self._get_timer()
-                return
+            if resuming:
+                print(f"Resuming '{self.name}', status: '{self.status}'")
+                # get back into the posture we had after picking the crystals
+                self._player.crouch()
+                self._player.turn_y_by(80)
 
-            self._walk_to_dedi()
-            self._open_crystals()
+            # open the crystals and deposit the items into dedis
+            if self.status == Status.WAITING_FOR_CRYSTALS:
+                try:
+                    self._pick_crystals()
+                except NoCrystalAddedError:
+                    if self.gen2:
+                        self._get_timer()
+                    return
+                self.status = Status.CRYSTALS_PICKED
+
+            if self.status == Status.CRYSTALS_PICKED:
+                self._walk_to_dedi()
+                self._open_crystals()
+                self.status = Status.CRYSTALS_OPENED
+            elif resuming:
+                # the crystals are opened already, only get back to the dedis
+                self._walk_to_dedi()
 
             if self.settings.stryder_depositing:
                 resources_deposited = self.deposit_into_stryder()
@@ -182,6 +261,7 @@ class CrystalStation(Station):
                     self._arb_station.add_wood(resources_deposited[FUNGAL_WOOD])
             else:
                 resources_deposited = self.deposit_dedis()
+            self.status = Status.WAITING_FOR_CRYSTALS
 
             # put items into vault
             vault_full = self.deposit_items()
@@ -190,13 +270,17 @@ class CrystalStation(Station):
 
             # increase the counters
             self._total_pickups += 1
-            for item, amount in resources_deposited.items():
-                got = self._resources_made.get(item, 0)
-                self._resources_made[item] = got + amount
+            self._resources_made.update(resources_deposited)
 
-            embed = self.create_embed(resources_deposited, round(time.time() - start))
+            embed = self.create_embed(resources_deposited, round(time.monotonic() - start))
             self._webhook.send_embed(embed)
 
+        except Exception:
+            # resuming did not help either, start over on the next run
+            if resuming:
+                self.status = Status.WAITING_FOR_CRYSTALS
+            raise
+
         finally:
             self.last_completed = datetime.now()
 
@@ -207,15 +291,14 @@ class CrystalStation(Station):
         self.stryder.access()
         self.stryder.inventory.drop_all()
 
-        for item in [DUST, FLINT, STONE, FUNGAL_WOOD, BLACK_PEARL]:
+        for item in self._STRYDER_ITEMS:
             self._player.inventory.delete_search()
             self._player.inventory.search(item)
             self._player.sleep(0.3)
 
             stacks = self._player.inventory.count(item)
-            profits[item] = max(
-                int((stacks * item.stack_size) - (0.5 * item.stack_size)), 0
-            )
+            # assume the last stack is half full, (stacks - 0.5) * stack_size
+            profits[item] = max((2 * stacks - 1) * item.stack_size // 2, 0)
             if stacks:
                 self._player.inventory.transfer_all()
 
@@ -299,10 +382,15 @@ class CrystalStation(Station):
         """Slowly walks foward spaming the pick-up key to pick all the
         crystals while being angled slighty downwards.
         """
-        for _ in range(9):
-            self._player.pick_all()
-            self._player.sleep(0.1)
-            self._player.walk("w", duration=0.2)
+        # keep walking while spamming F rather than alternating between the two
+        input.keyDown("w")
+        try:
+            deadline = time.perf_counter() + self._PICKUP_WALK_DURATION
+            while time.perf_counter() < deadline:
+                self._player.pick_all()
+                self._player.sleep(self._PICKUP_INTERVAL)
+        finally:
+            input.keyUp("w")
 
         self._player.walk("w", 2)
 
@@ -351,10 +439,20 @@ class CrystalStation(Station):
             self._player.set_hotbar()
             self._first_pickup = False
 
-        # open until no crystals left in inventory
-        while self._player.inventory.has(GACHA_CRYSTAL, is_searched=True):
+        # open until no crystals left in inventory, an extra hotbar spam
+        # is much cheaper than looking for crystals every single time
+        for tick in range(self._MAX_OPEN_TICKS):
             self._player.spam_hotbar()
             self._player.pick_up()
+            if tick % self._OPEN_CHECK_EVERY == 0 and not self._player.inventory.has(
+                GACHA_CRYSTAL, is_searched=True
+            ):
+                break
+        else:
+            print(
+                f"Crystals still left after {self._MAX_OPEN_TICKS} hotbar spams, "
+                "moving on anyway!"
+            )
 
         # go over the hotbar 5 more times to ensure no crystals left behind
         for _ in range(5):
@@ -371,16 +469,10 @@ class CrystalStation(Station):
         A dictionary containing the amounts of items deposited for dust and pearls
         """
         gains = {DUST: 0, BLACK_PEARL: 0}
-        turns = [
-            lambda: self._player.turn_x_by(40, delay=0.2),
-            lambda: self._player.turn_y_by(-50, delay=0.2),
-            lambda: self._player.turn_x_by(-80, delay=0.2),
-            lambda: self._player.turn_y_by(50, delay=0.2),
-        ]
 
         # go through each turn depositing into dedi
-        for turn in turns:
-            turn()
+        for turn, value in self._DEDI_TURNS:
+            getattr(self._player, turn)(value, delay=0.2)
 
             item_deposited = self.dedi.deposit([DUST, BLACK_PEARL], get_amount=True)
             if item_deposited is None:
@@ -395,15 +487,13 @@ class CrystalStation(Station):
         return gains
 
     def need_to_access_top_vault(self) -> bool:
-        return any(
-            self._player.inventory.has(item)
-            for item in [
-                TREE_PLATFORM,
-                BEHEMOTH_GATE,
-                BEHEMOTH_GATEWAY,
-                METAL_GATE,
-                METAL_GATEWAY,
-            ]
+        # `Inventory.has` would take a new screenshot for each of the items
+        return locate_any(
+            self._player.inventory.window,
+            [item.inventory_icon for item in self._TOP_VAULT_ITEMS],
+            self._INVENTORY_ITEM_REGION,
+            confidence=self._INVENTORY_ITEM_CONFIDENCE,
+            grayscale=True,
         )
 
     def deposit_items(self) -> bool:
@@ -428,7 +518,7 @@ class CrystalStation(Station):
         else:
             vault_full = True
 
-        if not self.need_to_access_top_vault() or self.settings.stryder_depositing:
+        if self.settings.stryder_depositing or not self.need_to_access_top_vault():
             self._get_timer()
             self.vault.close()
             return vault_full
@@ -465,11 +555,9 @@ class CrystalStation(Station):
         ----------
         The given amount if its within a valid range, else the average amount
         """
-        try:
-            average_amount = round(
-                self._resources_made.get(DUST, 0) / self._total_pickups
-            )
-        except ZeroDivisionError:
+        if self._total_pickups:
+            average_amount = round(self._resources_made[DUST] / self._total_pickups)
+        else:
             # assume 6000 dust / minute, or 100 / second
             average_amount = round(100 * self.settings.crystal_interval)
 
@@ -479,25 +567,28 @@ class CrystalStation(Station):
 
     def create_embed(self, profit: dict[Item, int], time_taken: int) -> Embed:
         crystals = round(profit[DUST] / 120)
-        embed = Embed(
-            type="rich",
-            title=f"Collected crystals at '{self._name}'!",
-            color=0x07F2EE,
-        )
-        embed.add_field(name="Time taken:ㅤㅤㅤ", value=f"{time_taken} seconds")
-        embed.add_field(name="Crystals opened:", value=f"~{crystals} crystals")
-
+        values = {
+            "Time taken:ㅤㅤㅤ": f"{time_taken} seconds",
+            "Crystals opened:": f"~{crystals} crystals",
+        }
         for item, amount in profit.items():
-            if not amount:
-                continue
-
-            formatted_amount = f"{amount:_}".replace("_", " ")
-            embed.add_field(name=item.name, value=formatted_amount)
+            if amount:
+                values[item.name] = format_amount(amount)
 
-        for _ in range((len([item for item, amount in profit.items() if amount]) + 2) % 3):
-            embed.add_field(name="\u200b", value="\u200b")
-
-        embed.set_thumbnail(url=self.CRYSTAL_AVATAR)
-        embed.set_footer(text="Ling Ling on top!")
+        fields = [
+            {"name": name, "value": value, "inline": True}
+            for name, value in values.items()
+        ]
+        # blank fields to keep the inline layout aligned
+        fields.extend(
+            {"name": "\u200b", "value": "\u200b", "inline": True}
+            for _ in range(len(fields) % 3)
+        )
 
-        return embed
+        return Embed.from_dict(
+            {
+                **self._EMBED_TEMPLATE,
+                "title": f"Collected crystals at '{self._name}'!",
+                "fields": fields,
+            }
+        )
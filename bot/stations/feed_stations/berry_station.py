@@ -21,6 +21,13 @@ class BerryFeedStation(FeedStation):
     """
 
     MEJOBERRY_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/0/00/Mejoberry.png/revision/latest/scale-to-width-down/228?cb=20160219215159"
+
+    _EMBED_TEMPLATE = {
+        "type": "rich",
+        "color": 0xFC97E8,
+        "thumbnail": {"url": MEJOBERRY_AVATAR},
+        "footer": {"text": "Ling Ling on top!"},
+    }
     _BERRIES = [
         items.MEJOBERRY,
         items.NARCOBERRY,
@@ -48,9 +55,10 @@ class BerryFeedStation(FeedStation):
         settings = BerryStationSettings.load()
         if not settings.enabled:
             return []
+        prefix = settings.berry_prefix
         return [
             BerryFeedStation(
-                f"{settings.berry_prefix}{i:02d}",
+                f"{prefix}{i:02d}",
                 player,
                 tribelog,
                 info_webhook,
@@ -93,22 +101,24 @@ class BerryFeedStation(FeedStation):
         ---------
         A formatted `discord.Embed` displaying the station statistics
         """
-        embed = Embed(
-            type="rich",
-            title=f"Finished berry station {self.name}!",
-            color=0xFC97E8,
+        return Embed.from_dict(
+            {
+                **self._EMBED_TEMPLATE,
+                "title": f"Finished berry station {self.name}!",
+                "fields": [
+                    {
+                        "name": "Time taken:ㅤ",
+                        "value": f"{time_taken} seconds",
+                        "inline": True,
+                    },
+                ],
+            }
         )
 
-        embed.add_field(name="Time taken:ㅤ", value=f"{time_taken} seconds")
-
-        embed.set_thumbnail(url=self.MEJOBERRY_AVATAR)
-        embed.set_footer(text="Ling Ling on top!")
-        return embed
-
     def complete(self) -> None:
         """Runs the feed station."""
         self.spawn()
-        start = time.time()
+        start = time.monotonic()
 
         try:
             self._player.crouch()
@@ -116,7 +126,7 @@ class BerryFeedStation(FeedStation):
             self.do_crop_plots(took_pellets)
             self.fill_troughs(self._BERRIES)
 
-            self._webhook.send_embed(self.create_embed(round(time.time() - start)))
+            self._webhook.send_embed(self.create_embed(round(time.monotonic() - start)))
 
         finally:
             self.last_completed = datetime.now()
@@ -35,6 +35,13 @@ class MeatFeedStation(FeedStation):
 
     RAW_MEAT_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/e/e9/Raw_Meat.png/revision/latest/scale-to-width-down/228?cb=20150704150605"
 
+    _EMBED_TEMPLATE = {
+        "type": "rich",
+        "color": 0xFC97E8,
+        "thumbnail": {"url": RAW_MEAT_AVATAR},
+        "footer": {"text": "Ling Ling on top!"},
+    }
+
     def __init__(
         self,
         name: str,
@@ -45,6 +52,7 @@ class MeatFeedStation(FeedStation):
     ) -> None:
         super().__init__(name, player, tribelog, webhook, interval)
         self.bear = Dinosaur("Dire Bear", "assets/templates/dire_bear.png")
+        self.trough_bed = Bed(name[:-2] + "b" + name[-2:])
         self._load_last_completion("meat")
 
     @staticmethod
@@ -54,9 +62,10 @@ class MeatFeedStation(FeedStation):
         settings = MeatStationSettings.load()
         if not settings.enabled:
             return []
+        prefix = settings.meat_prefix
         return [
             MeatFeedStation(
-                f"{settings.meat_prefix}{i:02d}",
+                f"{prefix}{i:02d}",
                 player,
                 tribelog,
                 info_webhook,
@@ -69,13 +78,10 @@ class MeatFeedStation(FeedStation):
         """Travels to the stations secondary bed, that has a `b` in front
         of its numeric suffix created by the beds `create_secondary` method.
         """
-        name = self.bed.name
-        new_bed = Bed(name[:-2] + "b" + name[-2:])
-
         self._player.prone()
         self._player.look_down_hard()
 
-        new_bed.spawn()
+        self.trough_bed.spawn()
         self._player.spawn_in()
 
     def approach_dire_bear(self) -> None:
@@ -184,26 +190,32 @@ class MeatFeedStation(FeedStation):
         ---------
         A formatted `discord.Embed` displaying the station statistics
         """
-        embed = Embed(
-            type="rich",
-            title=f"Finished meat station {self._name}!",
-            color=0xFC97E8,
+        return Embed.from_dict(
+            {
+                **self._EMBED_TEMPLATE,
+                "title": f"Finished meat station {self._name}!",
+                "fields": [
+                    {
+                        "name": "Time taken:ㅤ",
+                        "value": f"{time_taken} seconds",
+                        "inline": True,
+                    },
+                    {
+                        "name": "Meat deposited:ㅤ",
+                        "value": f"~{meat_profit}",
+                        "inline": True,
+                    },
+                    {"name": "Pellets refilled", "value": str(refilled), "inline": True},
+                ],
+            }
         )
 
-        embed.add_field(name="Time taken:ㅤ", value=f"{time_taken} seconds")
-        embed.add_field(name="Meat deposited:ㅤ", value=f"~{meat_profit}")
-        embed.add_field(name="Pellets refilled", value=refilled)
-
-        embed.set_thumbnail(url=self.RAW_MEAT_AVATAR)
-        embed.set_footer(text="Ling Ling on top!")
-        return embed
-
     def complete(self) -> None:
         """Completes the station, returns an embed displaying the
         statistics, and the statistics object itself."""
         try:
             self.spawn()
-            start = time.time()
+            start = time.monotonic()
             self.get_meat()
             self.walk_to_spawn()
             self.travel_to_trough_bed()
@@ -217,7 +229,7 @@ class MeatFeedStation(FeedStation):
 
             self._webhook.send_embed(
                 self.create_embed(
-                    round(time.time() - start), meat_harvested, need_refill
+                    round(time.monotonic() - start), meat_harvested, need_refill
                 )
             )
             self.last_completed = datetime.now()
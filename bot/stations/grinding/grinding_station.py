@@ -1,8 +1,10 @@
+import atexit
+import os
 import time
-from itertools import cycle
-from typing import Iterable
+from typing import Optional
 
 import cv2  # type: ignore[import]
+import numpy as np
 from ark import (ArkWindow, Bed, Dinosaur, IndustrialGrinder, Player,
                  Structure, TekDedicatedStorage, TribeLog, exceptions, items,
                  tools)
@@ -10,7 +12,13 @@ from discord import Embed  # type: ignore[import]
 from PIL import Image  # type: ignore[import]
 from pytesseract import pytesseract as tes  # type: ignore[import]
 
-from ...tools import format_seconds, mss_to_pil
+try:
+    from tesserocr import PSM, PyTessBaseAPI  # type: ignore[import]
+except ImportError:
+    # optional, without it every OCR call spawns a tesseract process
+    PyTessBaseAPI = None
+
+from ...tools import format_amount, format_seconds
 from ...webhooks import InfoWebhook
 from .._station import Station
 from ._exceptions import DedisNotDetermined
@@ -21,6 +29,22 @@ from ._status import Status
 # map common mistakes in the dedi OCR
 DEDI_NUMBER_MAPPING = {"l": "1", "i": "1", "I": "1", "|": "1", "O": "0"}
 
+
+class _DediDigits(dict[int, int]):
+    """Translation table keeping the digits, applying the mapping
+    and dropping any other character."""
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+_DEDI_DIGITS = _DediDigits(
+    str.maketrans(
+        "0123456789" + "".join(DEDI_NUMBER_MAPPING),
+        "0123456789" + "".join(DEDI_NUMBER_MAPPING.values()),
+    )
+)
+
 # the default mats we assume when the dedis could not be determined
 DEFAULT_MATS: dict[items.Item, int] = {
     items.SILICA_PEARL: 5211,
@@ -31,6 +55,75 @@ DEFAULT_MATS: dict[items.Item, int] = {
     items.HIDE: 20000,
 }
 
+# tesseracts openmp threading only adds overhead on our tiny dedi crops
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+DEDI_WHITELIST = "0123456789liI|O"
+DEDI_OCR_CONFIG = f"-c tessedit_char_whitelist={DEDI_WHITELIST} --psm 6"
+
+# black padding between the dedi masks when stacking them for a single OCR pass
+_DEDI_SEPARATOR = 20
+
+def _stack_masks(masks: list[np.ndarray]) -> np.ndarray:
+    """Stacks the masks vertically with padding between them so tesseract
+    reads each of them as its own line."""
+    pad = _DEDI_SEPARATOR
+    height = sum(mask.shape[0] for mask in masks) + pad * (len(masks) + 1)
+    width = max(mask.shape[1] for mask in masks) + pad * 2
+    combined = np.zeros((height, width), np.uint8)
+
+    y = pad
+    for mask in masks:
+        h, w = mask.shape
+        combined[y : y + h, pad : pad + w] = mask
+        y += h + pad
+    return combined
+
+
+def _create_tess_api() -> Optional["PyTessBaseAPI"]:
+    """Creates a persistent tesseract instance for the dedi OCR if tesserocr
+    is installed, using the tessdata next to the configured executable."""
+    if PyTessBaseAPI is None:
+        return None
+
+    tessdata = os.path.join(os.path.dirname(tes.tesseract_cmd), "tessdata")
+    try:
+        api = PyTessBaseAPI(path=tessdata, lang="eng", psm=PSM.SINGLE_BLOCK)
+    except RuntimeError as e:
+        print(f"Failed to load tesserocr, falling back to pytesseract!\n{e}")
+        return None
+
+    api.SetVariable("tessedit_char_whitelist", DEDI_WHITELIST)
+    atexit.register(api.End)
+    return api
+
+
+def _read_dedi_amounts(
+    masks: list[np.ndarray], api: Optional["PyTessBaseAPI"] = None
+) -> list[str]:
+    """OCRs the dedi masks, using the persistent tesserocr `api` if given.
+
+    Otherwise all masks are read in one tesseract call, falling back to one
+    call per mask if the lines could not be matched back to the masks."""
+    if api is not None:
+        amounts = []
+        for mask in masks:
+            api.SetImage(Image.fromarray(mask))
+            amounts.append(api.GetUTF8Text().strip())
+        return amounts
+
+    result = tes.image_to_string(
+        Image.fromarray(_stack_masks(masks)), config=DEDI_OCR_CONFIG
+    )
+    lines = [line.strip() for line in result.splitlines() if line.strip()]
+    if len(lines) == len(masks):
+        return lines
+
+    return [
+        tes.image_to_string(Image.fromarray(mask), config=DEDI_OCR_CONFIG).strip()
+        for mask in masks
+    ]
+
 
 class GrindingStation(Station):
 
@@ -70,6 +163,13 @@ class GrindingStation(Station):
 
     _CRAFTABLES_MAP = {item.name: item for item in _SUPPORTED_CRAFTABLES}
 
+    # time to let the view settle before and after turning between stations,
+    # and between each single turn along the way
+    _TURN_SETTLE_DELAY = 1
+    _TURN_STEP_DELAY = 0.3
+
+    _DEDI_ATTEMPTS = 10
+
     def __init__(
         self,
         player: Player,
@@ -88,6 +188,8 @@ class GrindingStation(Station):
             self.item_to_craft = self._CRAFTABLES_MAP[self.settings.item_to_craft]
 
         self.bed = Bed("grinding")
+        self.dedi_transfer_bed = Bed("dedi_transfer")
+        self.vault_transfer_bed = Bed("vault_transfer")
         self.ready = False
         self.status = Status.WAITING_FOR_ITEMS
         self.current_station = "Gear Vault"
@@ -97,6 +199,7 @@ class GrindingStation(Station):
         self.vault = Structure("Vault", "assets/templates/vault_capped.png")
         self.exo_mek = Dinosaur("Exo Mek", "assets/templates/exo_mek.png")
         self.screen = ArkWindow()
+        self._tess = _create_tess_api()
 
         self.STATION_MAPPING: dict[str, tuple | list] = {
             "Grinder": (self._player.turn_x_by, -50),
@@ -114,6 +217,9 @@ class GrindingStation(Station):
             ],
         }
 
+        # the stations never change, so compute the paths between them once
+        self._paths = self._compute_paths()
+
     def spawn(self) -> None:
         """Override spawn method to set current station"""
         super().spawn()
@@ -172,13 +278,13 @@ class GrindingStation(Station):
         """Grinds the gear down, determines the amount of resources we have
         and calculates the optimal crafting."""
         self.spawn()
-        start = time.time()
+        start = time.monotonic()
 
         self.grind_armor()
         self.grind_weapons()
         self.empty_grinder(turn_off=True)
 
-        embed = self._create_grinding_finished_embed(round(time.time() - start))
+        embed = self._create_grinding_finished_embed(round(time.monotonic() - start))
         self._webhook.send_embed(embed)
 
         if self.item_to_craft is None:
@@ -307,27 +413,47 @@ class GrindingStation(Station):
         # get the metal and deposit it into the dedi
         self.drop_script_from_grinder(items.METAL_INGOT)
 
-    def get_cycle(self, stations: Iterable[str]) -> cycle:
-        """Converts the list of our stations to a `cycle` object starting at
-        our current station to help find the quickest way to the target station.
-
-        Parameters:
-        -----------
-        stations :class:`Iterable`:
-            The stations to convert to the cycle
+    def _compute_paths(self) -> dict[tuple[str, str], tuple[list[str], str]]:
+        """Computes the quickest way from every station to every other station,
+        forwards and backwards possibilities are considered, the shorter is kept.
 
         Returns:
-        ----------
-        A `cycle` object with the iteration pointer on the current station.
+        --------
+        A dict mapping each (start, target) pair to the stations to go through
+        and the direction to go in.
         """
-        # convert to cycle
-        stations = cycle(stations)
+        stations = list(self.STATION_MAPPING)
+        n = len(stations)
+
+        # doubled so any wrapped path is a plain slice
+        forwards = stations * 2
+        backwards = stations[::-1] * 2
+        paths: dict[tuple[str, str], tuple[list[str], str]] = {}
 
-        # set the cycle pointer to current station
-        for station in stations:
-            if station == self.current_station:
-                return stations
-        raise Exception("Not sure how we got here...")
+        for i, start in enumerate(stations):
+            for j, target in enumerate(stations):
+                if i == j:
+                    continue
+
+                # going forwards, the path consists of the stations after the start
+                forward_steps = (j - i) % n
+                # going backwards, the path begins at the start station, backwards
+                # wins if both paths are of the same length
+                backward_steps = (i - j) % n
+
+                if backward_steps + 1 <= forward_steps:
+                    k = n - 1 - i
+                    paths[(start, target)] = (
+                        backwards[k : k + backward_steps + 1],
+                        "backwards",
+                    )
+                else:
+                    paths[(start, target)] = (
+                        forwards[i + 1 : i + 1 + forward_steps],
+                        "forward",
+                    )
+
+        return paths
 
     def find_quickest_way_to(self, target_station: Stations) -> tuple[list[str], str]:
         """Finds the quickest way to the passed target station, forwards
@@ -346,35 +472,14 @@ class GrindingStation(Station):
         --------
         `InvalidStationError` if you passed a station that doesnt exist.
         """
-        # ensure the passed station exists to avoid looping infinitely
+        # ensure the passed station exists
         if not target_station in self.STATION_MAPPING:
             raise ValueError(f"{target_station} is not a valid station!")
 
         if target_station == self.current_station:
             return [], "stay"
 
-        # remove values from keys to get an proper iterable
-        stations = list(self.STATION_MAPPING)
-
-        # get the amount of station to go through if we move forwards
-        # use itertools cycle method to allow counting over lists end
-        forward_path = []
-        for station in self.get_cycle(stations):
-            forward_path.append(station)
-            if station == target_station:
-                break
-
-        backward_path = [self.current_station]
-        for station in self.get_cycle(reversed(stations)):
-            backward_path.append(station)
-            if station == target_station:
-                break
-
-        # compare both resulting lists, return the shorter one together with
-        # the direction
-        if len(forward_path) < len(backward_path):
-            return forward_path, "forward"
-        return backward_path, "backwards"
+        return self._paths[(self.current_station, target_station)]
 
     def turn_to(self, target_station: Stations) -> None:
         """Turns to the given station using the fastest way around possible.
@@ -389,7 +494,9 @@ class GrindingStation(Station):
         """
         # get the quickest path and the direction
         path, direction = self.find_quickest_way_to(target_station)
-        self._player.sleep(1)
+        if not path:
+            return
+        self._player.sleep(self._TURN_SETTLE_DELAY)
 
         for station in path:
             self.current_station = station
@@ -402,13 +509,13 @@ class GrindingStation(Station):
             if isinstance(self.STATION_MAPPING[station], list):
                 for func, amount in self.STATION_MAPPING[station]:
                     func(amount * (-1 if direction == "backwards" else 1))
-                    self._player.sleep(0.3)
+                    self._player.sleep(self._TURN_STEP_DELAY)
                 continue
 
             func, amount = self.STATION_MAPPING[station]
             func(amount * (-1 if direction == "backwards" else 1))
-            self._player.sleep(0.3)
-        self._player.sleep(1)
+            self._player.sleep(self._TURN_STEP_DELAY)
+        self._player.sleep(self._TURN_SETTLE_DELAY)
 
     def grind(self, item: items.Item, take: list[items.Item]) -> None:
         """Turns to the grinder and grinds the item, then takes all requested
@@ -598,7 +705,11 @@ class GrindingStation(Station):
         self.turn_to(Stations.from_item(item))
         self.dedi.deposit([item], get_amount=False)
 
-    def get_dedi_screenshot(self, spawn: bool = True) -> Image.Image:
+    def get_dedi_screenshot(
+        self,
+        spawn: bool = True,
+        region: tuple[int, int, int, int] = (0, 0, 1920, 1080),
+    ) -> np.ndarray:
         """Grabs a screenshot of the dedi wall to later determine the
         amount of resources available.
 
@@ -607,9 +718,12 @@ class GrindingStation(Station):
         spawn :class:`bool`:
             Whether the bot should resync to the bed first
 
+        region :class:`tuple`:
+            The area of the screen to grab as (x, y, w, h)
+
         Returns:
         ----------
-        A PIL Image of the current dedi wall.
+        An RGB array of the current dedi wall.
         """
 
         # sync to bed, look at dedi wall
@@ -621,13 +735,14 @@ class GrindingStation(Station):
         # screen temporarily for better clarity
         self._player.hide_hands()
 
-        # save the result, enable HUD and return the Image
-        img = self.screen.grab_screen(region=(0, 0, 1920, 1080))
+        # keep the result in memory, enable HUD and return the array
+        img = self.screen.grab_screen(region=region)
 
         self._player.sleep(0.5)
         self._player.disable_hud()
 
-        return mss_to_pil(img)
+        # mss gives us BGRA, reverse the first three channels to get RGB
+        return np.asarray(img, dtype=np.uint8)[:, :, 2::-1]
 
     def walk_back_little(self) -> None:
         """Crouches and walks back a tiny bit, attempting to getting a better
@@ -680,7 +795,7 @@ class GrindingStation(Station):
         """Tries to get the dedi materials up to 10 times. Will return a dict
         of the material and its amount on the first successful attempt.
 
-        Raises `DediNotFoundError` after 10 unsuccessful attempts.
+        Raises `DedisNotDetermined` after 10 unsuccessful attempts.
         """
 
         dedi_to_region = {
@@ -692,25 +807,60 @@ class GrindingStation(Station):
             items.HIDE: self.settings.hide_region,
         }
 
-        img = self.get_dedi_screenshot(True)
-        amounts = {}
-        for item, region in dedi_to_region.items():
-            roi = img.crop(
-                (region[0], region[1], region[0] + region[2], region[1] + region[3])
-            )
-            denoised_roi = self.screen.denoise_text(roi, self.settings.text_rgb, 22)
-            amount: str = tes.image_to_string(
-                denoised_roi,
-                config="-c tessedit_char_whitelist=0123456789liI|O --psm 6",
-            ).replace("\n", "")
+        # only grab the area spanning the dedi regions rather than the
+        # whole screen, the regions are then shifted into that area
+        regions = dedi_to_region.values()
+        left = min(x for x, _, _, _ in regions)
+        top = min(y for _, y, _, _ in regions)
+        right = max(x + w for x, _, w, _ in regions)
+        bottom = max(y + h for _, y, _, h in regions)
+        bbox = (left, top, right - left, bottom - top)
+
+        for attempt in range(self._DEDI_ATTEMPTS):
+            # only resync to the bed once, after that try a different view
+            if attempt:
+                self.walk_back_little()
+
+            # the regions are then just views into the screenshot array
+            frame = self.get_dedi_screenshot(not attempt, bbox)
+            masks = [
+                self.screen.denoise_text(
+                    frame[y - top : y - top + h, x - left : x - left + w],
+                    self.settings.text_rgb,
+                    22,
+                )
+                for x, y, w, h in regions
+            ]
+
+            try:
+                return self._parse_dedi_amounts(list(dedi_to_region), masks, debug)
+            except ValueError as e:
+                print(f"Attempt {attempt + 1} to determine the dedis failed!\n{e}")
+
+        raise DedisNotDetermined(
+            f"Failed to determine the dedis after {self._DEDI_ATTEMPTS} attempts!"
+        )
 
-            # replace common tesseract fuckups
-            for char, new_char in DEDI_NUMBER_MAPPING.items():
-                amount = amount.replace(char, new_char)
+    def _parse_dedi_amounts(
+        self, dedis: list[items.Item], masks: list[np.ndarray], debug: bool
+    ) -> dict[items.Item, int]:
+        """OCRs the masked dedi regions and validates the amounts.
+
+        Raises `ValueError` if any of the amounts could not be read or is not
+        within a logical range.
+        """
+        amounts = {}
+        for item, denoised_roi, amount in zip(
+            dedis, masks, _read_dedi_amounts(masks, self._tess)
+        ):
+            # replace common tesseract fuckups, strip stray whitespace
+            amount = amount.translate(_DEDI_DIGITS)
 
             if debug:
                 cv2.imshow(f"{item.name} - {amount}", denoised_roi)
                 cv2.waitKey(0)
+            if not amount:
+                raise ValueError(f"Could not read any digits for {item.name}!")
             final_result = int(amount)
 
             # validate that the result is within a logical range
@@ -775,7 +925,7 @@ class GrindingStation(Station):
             items.ELEMENT,
         ]
         for resource, amount in self.total_session_cost.items():
-            formatted[resource] = f"{amount:_}x".replace("_", " ")
+            formatted[resource] = f"{format_amount(amount)}x"
         formatted = {k: formatted[k] for k in desired_order if k in formatted}
 
         # create embed, black sidebar
@@ -826,7 +976,7 @@ class GrindingStation(Station):
         queue up."""
 
         try:
-            time_diff = round(time.time() - self.last_crafted)
+            time_diff = round(time.monotonic() - self.last_crafted)
             time_left = max(0, (3 * 60) - time_diff)
             if not time_left:
                 print("Grinding station has finished crafting.")
@@ -918,7 +1068,7 @@ class GrindingStation(Station):
                 self._player.sleep(0.3)
             self.pickup_final_craft(spawn=False)
         else:
-            self.last_crafted = time.time()
+            self.last_crafted = time.monotonic()
             self.status = Status.AWAITING_PICKUP
 
     def pickup_final_craft(self, spawn: bool = True) -> None:
@@ -968,7 +1118,7 @@ class GrindingStation(Station):
             craft_amount = min(amount, 1000)
             self.craft(item, craft_amount)
             self.subcomponents_to_craft[item] -= craft_amount
-            self.last_crafted = time.time()
+            self.last_crafted = time.monotonic()
             break
 
         self._player.drop_all()
@@ -1052,10 +1202,9 @@ class GrindingStation(Station):
 
         Im sure theres a cleaner way to do this but it works.
         """
-        bed = Bed("dedi_transfer")
         self._player.look_down_hard()
         self._player.prone()
-        bed.spawn()
+        self.dedi_transfer_bed.spawn()
         self._tribelog.check_tribelogs()
         self._player.spawn_in()
 
@@ -1105,10 +1254,9 @@ class GrindingStation(Station):
         self.dedi.deposit([items.ELECTRONICS], get_amount=False)
 
     def _transfer_vault(self) -> None:
-        bed = Bed("vault_transfer")
         self._player.look_down_hard()
         self._player.prone()
-        bed.spawn()
+        self.vault_transfer_bed.spawn()
         self._player.spawn_in()
 
         self.vault.open()
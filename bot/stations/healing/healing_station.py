@@ -35,6 +35,14 @@ class HealingStation(Station):
 
     POD_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/0/0b/Tek_Sleeping_Pod_%28Aberration%29.png/revision/latest/scale-to-width-down/228?cb=20171214081119"
 
+    # the parts of the embed that never change, see `_create_embed`
+    _EMBED_TEMPLATE = {
+        "type": "rich",
+        "color": 0x4F4F4F,
+        "thumbnail": {"url": POD_AVATAR},
+        "footer": {"text": "Ling Ling on top!"},
+    }
+
     def __init__(
         self,
         player: Player,
@@ -48,7 +56,7 @@ class HealingStation(Station):
         self._tribelog = tribelog
         self._webhook = info_webhook
 
-        self._least_healed = time.time()
+        self._least_healed = time.monotonic()
         self.pod = TekSleepingPod(self._name)
 
     def is_ready(self) -> bool:
@@ -58,7 +66,7 @@ class HealingStation(Station):
         """Spawns at the healing station and enters the tek pod to heal,
         then leaves the tek pod and sends a healing statistics embed.
         """
-        start = time.time()
+        start = time.monotonic()
         try:
             self.spawn()
 
@@ -72,7 +80,7 @@ class HealingStation(Station):
             if not _helpers.await_event(self._player.has_died, max_duration=20):
                 raise
 
-        embed = self._create_embed(round(time.time() - start))
+        embed = self._create_embed(round(time.monotonic() - start))
         self._webhook.send_embed(embed)
 
     def spawn(self) -> None:
@@ -90,16 +98,14 @@ class HealingStation(Station):
     def _create_embed(self, time_taken: int) -> Embed:
         """Sends a msg to discord that we healed"""
         taken = format_seconds(time_taken)
-        interval = format_seconds(round(time.time() - self._least_healed))
-        embed = Embed(
-            type="rich",
-            title=f"Recovered player at '{self._name}'!",
-            color=0x4F4F4F,
+        interval = format_seconds(round(time.monotonic() - self._least_healed))
+        return Embed.from_dict(
+            {
+                **self._EMBED_TEMPLATE,
+                "title": f"Recovered player at '{self._name}'!",
+                "fields": [
+                    {"name": "Time taken:ㅤㅤㅤ", "value": taken, "inline": True},
+                    {"name": "Last healed:", "value": interval, "inline": True},
+                ],
+            }
         )
-        embed.add_field(name="Time taken:ㅤㅤㅤ", value=taken)
-        embed.add_field(name="Last healed:", value=interval)
-
-        embed.set_thumbnail(url=self.POD_AVATAR)
-        embed.set_footer(text="Ling Ling on top!")
-
-        return embed
@@ -7,6 +7,7 @@ from typing import final
 from ark import Bed, DinoExport, Gacha, Player, TekCropPlot, TribeLog, exceptions, items
 from discord import Embed  # type:ignore[import]
 
+from ...tools import RoundRobin
 from ...webhooks import InfoWebhook
 from .._crop_plot_helper import do_crop_plot_stack, set_stack_folders
 from .._station import Station
@@ -54,6 +55,12 @@ class YTrapStation(Station):
     Y_TRAP_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/c/cb/Plant_Species_Y_Trap_%28Scorched_Earth%29.png/revision/latest?cb=20160901233007"
     total_ytraps_collected = 0
 
+    _EMBED_TEMPLATE = {
+        "type": "rich",
+        "color": 0xFC97E8,
+        "thumbnail": {"url": Y_TRAP_AVATAR},
+    }
+
     def __init__(
         self,
         name: str,
@@ -76,12 +83,13 @@ class YTrapStation(Station):
         self.bed = Bed(name)
         self.gacha = Gacha(name)
         self.total_completions = 0
+        plots_per_stack = settings.plots_per_stack
         self._stacks = [
             [
                 TekCropPlot(f"Crop Plot {stack+ 1}:{idx+1}")
-                for idx in range(self.settings.plots_per_stack)
+                for idx in range(plots_per_stack)
             ]
-            for stack in range(self.settings.plot_stacks)
+            for stack in range(settings.plot_stacks)
         ]
 
     def is_ready(self) -> bool:
@@ -109,15 +117,16 @@ class YTrapStation(Station):
     @staticmethod
     def build_stations(
         player: Player, tribelog: TribeLog, info_webhook: InfoWebhook
-    ) -> itertools.cycle | list:
+    ) -> RoundRobin[YTrapStation] | list:
         settings = YTrapStationSettings.load()
         if not settings.enabled:
             return []
 
-        return itertools.cycle(
+        prefix = settings.ytrap_prefix
+        return RoundRobin(
             [
                 YTrapStation(
-                    f"{settings.ytrap_prefix}{i:02d}",
+                    f"{prefix}{i:02d}",
                     player,
                     tribelog,
                     info_webhook,
@@ -132,7 +141,7 @@ class YTrapStation(Station):
         empties the crop plots and fills the gacha.
         """
         self.spawn()
-        start = time.time()
+        start = time.monotonic()
         dead_crop_plots: list[TekCropPlot] = []
 
         self.refill = (
@@ -173,7 +182,7 @@ class YTrapStation(Station):
         self.total_completions += 1
 
         embed = self._create_embed(
-            round(time.time() - start), added_traps, dead_crop_plots
+            round(time.monotonic() - start), added_traps, dead_crop_plots
         )
         self._webhook.send_embed(embed)
 
@@ -322,29 +331,39 @@ class YTrapStation(Station):
         ---------
         A formatted `discord.Embed` displaying the station statistics
         """
-        embed = Embed(
-            type="rich",
-            title=f"Finished gacha station '{self._name}'!",
-            description=(self._validate_stats(time_taken, ytraps)),
-            color=0xFC97E8,
-        )
-
-        embed.add_field(name="Time taken:", value=f"{time_taken} seconds")
-        embed.add_field(name="Y-Traps:", value=ytraps)
-        embed.add_field(name="Pellets:", value=f"{round(self.pellet_coverage * 100)}%")
+        fields = [
+            {"name": "Time taken:", "value": f"{time_taken} seconds", "inline": True},
+            {"name": "Y-Traps:", "value": str(ytraps), "inline": True},
+            {
+                "name": "Pellets:",
+                "value": f"{round(self.pellet_coverage * 100)}%",
+                "inline": True,
+            },
+        ]
 
         if dead:
-            embed.add_field(
-                name="Dead crop plots:",
-                value="\n".join(
-                    f"Stack {plot.name.split(':')[0][-1]}, index {plot.name.split(':')[1]}"
-                    for plot in dead
-                ),
+            fields.append(
+                {
+                    "name": "Dead crop plots:",
+                    "value": "\n".join(
+                        f"Stack {plot.name.split(':')[0][-1]}, index {plot.name.split(':')[1]}"
+                        for plot in dead
+                    ),
+                    "inline": True,
+                }
             )
 
         if self.pellet_coverage < self.settings.min_pellet_coverage:
-            embed.set_footer(text="Station will be refilled text time.")
+            footer = "Station will be refilled text time."
         else:
-            embed.set_footer(text="Ling Ling on top!")
-        embed.set_thumbnail(url=self.Y_TRAP_AVATAR)
-        return embed
+            footer = "Ling Ling on top!"
+
+        return Embed.from_dict(
+            {
+                **self._EMBED_TEMPLATE,
+                "title": f"Finished gacha station '{self._name}'!",
+                "description": self._validate_stats(time_taken, ytraps),
+                "fields": fields,
+                "footer": {"text": footer},
+            }
+        )
@@ -1,11 +1,15 @@
 import functools
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Thread
-from typing import Callable
+from typing import Callable, Generic, Iterable, TypeVar
 
-import cv2 as cv  # type:ignore[import]
-import numpy as np
 from PIL import Image # type:ignore[import]
 
+T = TypeVar("T")
+
+_SPACE_SEPARATED = str.maketrans(",", " ")
+
 
 def threaded(name: str):
     """Threads a function, beware that it will lose its return values"""
@@ -21,10 +25,88 @@ def threaded(name: str):
     return outer
 
 
+def pooled(executor: ThreadPoolExecutor):
+    """Runs a function on the given executor instead of a new thread, beware
+    that it will lose its return values"""
+
+    def outer(func: Callable):
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            future = executor.submit(func, *args, **kwargs)
+            future.add_done_callback(_print_exception)
+
+        return inner
+
+    return outer
+
+
+def _print_exception(future: Future) -> None:
+    # executors swallow exceptions silently, print them like a thread would
+    if (exc := future.exception()) is not None:
+        traceback.print_exception(exc)
+
+
+class RoundRobin(Generic[T]):
+    """Endlessly iterates over the given items in order. Unlike `itertools.cycle`
+    it does not keep a copy of what it already yielded and the items remain
+    accessible through `items`.
+
+    Parameters
+    ----------
+    items :class:`Iterable`:
+        The items to iterate over
+    """
+
+    def __init__(self, items: Iterable[T]) -> None:
+        self.items = list(items)
+        self._index = 0
+
+    def __iter__(self) -> "RoundRobin[T]":
+        return self
+
+    def __next__(self) -> T:
+        if not self.items:
+            raise StopIteration
+
+        item = self.items[self._index]
+        self._index = (self._index + 1) % len(self.items)
+        return item
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
 def mss_to_pil(image) -> Image.Image:
-    img_array = np.asarray(image)
-    image_rgb = cv.cvtColor(img_array, cv.COLOR_BGR2RGB)
-    return Image.fromarray(image_rgb)
+    """Converts a mss screenshot to a PIL image by decoding its raw BGRA buffer
+    directly, without the intermediate numpy array and color converted copy."""
+    return Image.frombytes("RGB", image.size, image.bgra, "raw", "BGRX")
+
+
+def locate_any(
+    window,
+    templates: Iterable[str],
+    region: tuple[int, int, int, int],
+    *,
+    confidence: float,
+    grayscale: bool = False,
+) -> bool:
+    """Checks whether any of the templates can be found within the region of
+    the given `ArkWindow`, grabbing the region once rather than per template."""
+    haystack = mss_to_pil(window.grab_screen(region))
+    return any(
+        window.locate_in_image(
+            window.convert_image(template),
+            haystack,
+            confidence=confidence,
+            grayscale=grayscale,
+        )
+        for template in templates
+    )
+
+
+def format_amount(amount: int) -> str:
+    """Formats a number with spaces as thousands separators, e.g 12 345"""
+    return format(amount, ",").translate(_SPACE_SEPARATED)
 
 
 def format_seconds(seconds: int) -> str:
@@ -1,3 +1,5 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional
 
@@ -5,8 +7,13 @@ from ark import ArkWindow
 from discord import File  # type:ignore[import]
 from discord import Embed, RequestsWebhookAdapter, Webhook
 from mss.screenshot import ScreenShot  # type:ignore[import]
+from requests import Session  # type:ignore[import]
 
-from ..tools import mss_to_pil, threaded
+from ..tools import mss_to_pil, pooled
+
+# shared by all info webhooks so sending reuses a bounded amount of threads
+_SEND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="discord")
+atexit.register(_SEND_POOL.shutdown, wait=False)
 
 
 class InfoWebhook:
@@ -20,12 +27,15 @@ class InfoWebhook:
 
     user_id :class:`str`:
         The discord id of the user to ping, with or without < >
+
+    session :class:`Optional[requests.Session]`:
+        The session to send the requests through, to share its connections
     """
 
     DISCORD_AVATAR = "https://i.kym-cdn.com/entries/icons/facebook/000/022/293/Bloodyshadow_rolled_user_shutupandsleepwith_i_m_bisexual_let_s_work_from__a48265eae6a474904cdc2cae9f184aad.jpg"
 
-    def __init__(self, url: str, user_id: str):
-        self._hook = Webhook.from_url(url, adapter=RequestsWebhookAdapter())
+    def __init__(self, url: str, user_id: str, session: Optional[Session] = None):
+        self._hook = Webhook.from_url(url, adapter=RequestsWebhookAdapter(session))
         self._hook.user = "Ling Ling"
         self._hook.avatar = self.DISCORD_AVATAR
         self.screen = ArkWindow()
@@ -43,7 +53,7 @@ class InfoWebhook:
     def url(self) -> str:
         return self._url
 
-    @threaded("Sending embed")
+    @pooled(_SEND_POOL)
     def send_embed(
         self, embed: Embed, *, img: Optional[ScreenShot] = None, mention: bool = False
     ) -> None:
@@ -80,7 +90,6 @@ class InfoWebhook:
         except Exception:
             print("Failed to send embed.")
 
-    @threaded("Sending error")
     def send_error(
         self,
         task: str,
@@ -100,6 +109,16 @@ class InfoWebhook:
         exception: :class:`Exception`:
             The description of the occured exception
         """
+        # grab the screen right away, by the time the pool gets to the post
+        # the bot may already be trying to unstuck itself
+        if image is None:
+            image = self.screen.grab_screen((0, 0, 1920, 1080))
+        self._send_error(task, exception, image, mention=mention)
+
+    @pooled(_SEND_POOL)
+    def _send_error(
+        self, task: str, exception: Exception, image: ScreenShot, *, mention: bool
+    ) -> None:
         embed = Embed(
             type="rich",
             title="Ran into a problem!",
@@ -112,9 +131,6 @@ class InfoWebhook:
 
         embed.set_image(url="attachment://image.png"),
 
-        if image is None:
-            image = self.screen.grab_screen((0, 0, 1920, 1080))
-
         image_pil = mss_to_pil(image)
 
         with BytesIO() as image_binary:
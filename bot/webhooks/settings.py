@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
+from typing import Optional
 
 import dacite
 
@@ -19,8 +20,9 @@ class DiscordSettings:
     state_message_id: str
 
     @staticmethod
-    def load() -> DiscordSettings:
-        with open("settings/settings.json") as f:
-            data = json.load(f)["discord"]
+    def load(config: Optional[dict] = None) -> DiscordSettings:
+        if config is None:
+            with open("settings/settings.json") as f:
+                config = json.load(f)
 
-        return dacite.from_dict(DiscordSettings, data)
+        return dacite.from_dict(DiscordSettings, config["discord"])
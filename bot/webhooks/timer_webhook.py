@@ -1,10 +1,12 @@
 import json
 import time
+from typing import Optional
 
 from ark import State, TribeLog
 from ark.server import Server, server_query
 from discord import Webhook  # type:ignore[import]
 from discord import RequestsWebhookAdapter, WebhookMessage
+from requests import Session  # type:ignore[import]
 
 from ..tools import threaded
 
@@ -21,13 +23,23 @@ class TimerWebhook:
 
     server :class:`Server`:
         The server to post updates for
+
+    session :class:`Optional[requests.Session]`:
+        The session to send the requests through, to share its connections
     """
 
     AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/1/18/Tek_Transmitter.png/revision/latest/scale-to-width-down/228?cb=20170131150002"
     ORIGINAL_MESSAGE: WebhookMessage | None = None
 
-    def __init__(self, url: str, server: Server, tribelog: TribeLog, timer_pop: int):
-        self._hook = Webhook.from_url(url, adapter=RequestsWebhookAdapter())
+    def __init__(
+        self,
+        url: str,
+        server: Server,
+        tribelog: TribeLog,
+        timer_pop: int,
+        session: Optional[Session] = None,
+    ):
+        self._hook = Webhook.from_url(url, adapter=RequestsWebhookAdapter(session))
         self._tribelog = tribelog
         self._url = url
         self._timer_pop = timer_pop
@@ -0,0 +1,74 @@
+import pytest
+
+for module in ("ark", "cv2", "dacite", "discord", "mss", "numpy", "pytesseract"):
+    pytest.importorskip(module)
+
+import numpy as np
+from ark import items
+
+from bot.stations.grinding import grinding_station
+from bot.stations.grinding._exceptions import DedisNotDetermined
+from bot.stations.grinding.grinding_station import GrindingStation
+
+DEDIS = 6
+VALID_READ = ["5000"] * DEDIS
+
+
+class _Screen:
+    @staticmethod
+    def denoise_text(image, denoise_rgb, variance):
+        return np.zeros(image.shape[:2], np.uint8)
+
+
+class _Settings:
+    text_rgb = (0, 0, 0)
+    pearls_region = paste_region = electronics_region = (0, 0, 10, 10)
+    ingots_region = crystal_region = hide_region = (0, 0, 10, 10)
+
+
+def _make_station(monkeypatch, reads: list[list[str]]) -> GrindingStation:
+    """Creates a station without going through `__init__`, the dedi wall
+    screenshot and OCR are replaced by the given `reads`, one per attempt."""
+    station = GrindingStation.__new__(GrindingStation)
+    station.settings = _Settings()
+    station.screen = _Screen()
+    station.item_to_craft = None
+    station._tess = None
+    station.screenshots = 0
+    station.walked_back = 0
+
+    def get_dedi_screenshot(spawn=True, region=(0, 0, 1920, 1080)):
+        station.screenshots += 1
+        return np.zeros((region[3], region[2], 3), np.uint8)
+
+    def walk_back_little():
+        station.walked_back += 1
+
+    station.get_dedi_screenshot = get_dedi_screenshot
+    station.walk_back_little = walk_back_little
+
+    results = iter(reads)
+    monkeypatch.setattr(
+        grinding_station, "_read_dedi_amounts", lambda masks, api=None: next(results)
+    )
+    return station
+
+
+def test_empty_read_is_retried(monkeypatch):
+    station = _make_station(monkeypatch, [["", *VALID_READ[1:]], VALID_READ])
+
+    amounts = station.get_dedi_materials()
+
+    assert amounts[items.SILICA_PEARL] == 5000
+    assert 0 not in amounts.values()
+    assert station.screenshots == 2
+    assert station.walked_back == 1
+
+
+def test_empty_reads_run_out_of_attempts(monkeypatch):
+    attempts = GrindingStation._DEDI_ATTEMPTS
+    station = _make_station(monkeypatch, [[" \n"] * DEDIS] * attempts)
+
+    with pytest.raises(DedisNotDetermined):
+        station.get_dedi_materials()
+    assert station.screenshots == attempts